@@ -13,5 +13,7 @@ class ImportMapDetailAdmin(admin.ModelAdmin):
     list_filter = ("target_datatype", "is_required")
     ordering = ("map_set", "source_path")
     list_display_links = ("source_path", "target_path")
+    # map_set.__str__ reads supplier/source_type, __str__ of the detail reads target_datatype
+    list_select_related = ("map_set__supplier", "map_set__source_type", "target_datatype")
 
 
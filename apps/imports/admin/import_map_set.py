@@ -13,4 +13,5 @@ class ImportMapSetAdmin(admin.ModelAdmin):
     ordering = ("supplier", "valid_from")
     list_filter = ("source_type", "valid_from")
     list_display_links = ("supplier", "source_type", "description")
+    list_select_related = ("organization", "supplier", "source_type")
 
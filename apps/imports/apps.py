@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ImportsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.imports'
+
+    def ready(self):
+        # Invalidate cached import configuration and reference lookups when edited
+        from apps.imports.services import config_cache, lookups
+
+        config_cache.connect_signals()
+        lookups.connect_signals()
@@ -20,7 +20,8 @@ Depends on:
     - apps.imports.api.elsaesser_filter_client.FilterTechnikApiClient (API access)
     - apps.imports.models.ImportRun (import session tracking)
     - apps.imports.models.ImportRawRecord (raw product payloads)
-    - apps.imports.models.ImportSourceType (to classify source type)
+    - apps.imports.services.raw_record_ops (COPY-based raw record ingest)
+    - apps.imports.models.ImportSourceType (to classify source type, cached via services.lookups)
     - apps.partners.models.Supplier (supplier reference)
     - Django transaction management and logging
 
@@ -43,8 +44,9 @@ from django.db import transaction
 from django.utils import timezone
 
 from apps.imports.models.import_run import ImportRun
-from apps.imports.models.import_raw_record import ImportRawRecord
 from apps.imports.models.import_source_type import ImportSourceType
+from apps.imports.services.lookups import get_source_type
+from apps.imports.services.raw_record_ops import bulk_insert_raw_records
 from apps.partners.models.supplier import Supplier
 from apps.imports.api.elsaesser_filter_client import FilterTechnikApiClient, ApiError
 
@@ -91,14 +93,13 @@ Notes:
 
         try:
             # Supplier prüfen
-            try:
-                supplier = Supplier.objects.get(supplier_code=supplier_code)
-            except Supplier.DoesNotExist:
+            supplier = Supplier.objects.filter(supplier_code=supplier_code).first()
+            if supplier is None:
                 raise CommandError(f"Supplier '{supplier_code}' not found")
 
             # SourceType prüfen
             try:
-                source_type = ImportSourceType.objects.get(code="api")
+                source_type = get_source_type("api")
             except ImportSourceType.DoesNotExist:
                 raise CommandError("ImportSourceType 'api' not found")
 
@@ -151,13 +152,12 @@ Notes:
                 source_type=source_type,
                 source_file=None,
                 started_at=timezone.now(),
-                status="running",
+                status=ImportRun.Status.RUNNING,
             )
 
             inserted = 0
             page = 1
             per_page = 100
-            line_number = 0
 
             while True:
                 payload = {"page": page, "limit": per_page}
@@ -168,20 +168,16 @@ Notes:
                 if not elements:
                     break
 
-                # Commit pro Page
+                if limit:
+                    elements = elements[: limit - inserted]
+
+                # Commit pro Page (one COPY per page instead of one INSERT per product)
                 with transaction.atomic():
-                    for product in elements:
-                        line_number += 1
-                        ImportRawRecord.objects.create(
-                            import_run=run,
-                            line_number=line_number,
-                            payload=product,
-                            supplier_product_reference=product.get("productNumber"),
-                        )
-                        inserted += 1
-
-                        if limit and inserted >= limit:
-                            break
+                    inserted += bulk_insert_raw_records(
+                        run,
+                        enumerate(elements, start=inserted + 1),
+                        reference_key="productNumber",
+                    )
 
                 # Wichtige Ausgabe: aktuelle Page und Gesamtanzahl
                 self.stdout.write(
@@ -196,10 +192,12 @@ Notes:
                 page += 1
                 time.sleep(0.25)  # Throttle
 
-            run.finished_at = timezone.now()
-            run.total_records = inserted
-            run.status = "success"
-            run.save()
+            # Single UPDATE of the three columns instead of a full-row save()
+            ImportRun.objects.filter(pk=run.pk).update(
+                finished_at=timezone.now(),
+                total_records=inserted,
+                status=ImportRun.Status.SUCCESS,
+            )
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -18,10 +18,11 @@ Used by:
     - Downstream processing tasks that consume `ImportRun` and `ImportRawRecord`
 
 Depends on:
-    - pandas (Excel parsing)
+    - apps.imports.services.excel_reader (batched Excel parsing via pandas)
+    - apps.imports.services.raw_record_ops (COPY-based raw record ingest)
     - apps.imports.models.ImportRun (import session tracking)
     - apps.imports.models.ImportRawRecord (raw Excel rows storage)
-    - apps.imports.models.ImportSourceType (to classify source type)
+    - apps.imports.models.ImportSourceType (to classify source type, cached via services.lookups)
     - apps.partners.models.Supplier (supplier reference)
     - Django transaction management and logging
 
@@ -43,21 +44,29 @@ Example:
 from __future__ import annotations
 
 import logging
-import traceback
+import os
 from pathlib import Path
+from typing import Any, Iterator, Tuple
 
+import numpy as np
 import pandas as pd
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
 from apps.imports.models.import_run import ImportRun
 from apps.imports.models.import_raw_record import ImportRawRecord
 from apps.imports.models.import_source_type import ImportSourceType
+from apps.imports.services.excel_reader import iter_excel_batches
+from apps.imports.services.lookups import get_source_type
+from apps.imports.services.raw_record_ops import analyze_raw_records, bulk_insert_raw_records
 from apps.partners.models.supplier import Supplier
 
 logger = logging.getLogger(__name__)
 
+# Data rows parsed, validated and inserted per step
+PARSE_BATCH_SIZE = 20000
+
 
 class Command(BaseCommand):
     """
@@ -95,45 +104,87 @@ By default, --supplier defaults to 70002 and the command looks in:
         if not base_dir.exists():
             raise CommandError(f"Data directory not found: {base_dir}")
 
-        years = [d for d in base_dir.iterdir() if d.is_dir() and d.name.isdigit()]
+        # os.scandir reuses the directory entry type/stat info instead of re-stat'ing paths
+        with os.scandir(base_dir) as it:
+            years = [e for e in it if e.is_dir() and e.name.isdigit()]
         if not years:
             raise CommandError(f"No year directories in {base_dir}")
-        latest_year = max(years, key=lambda d: d.name)
+        latest_year = max(years, key=lambda e: e.name).path
 
-        months = [d for d in latest_year.iterdir() if d.is_dir() and d.name.isdigit()]
+        with os.scandir(latest_year) as it:
+            months = [e for e in it if e.is_dir() and e.name.isdigit()]
         if not months:
             raise CommandError(f"No month directories in {latest_year}")
-        latest_month = max(months, key=lambda d: d.name)
+        latest_month = max(months, key=lambda e: e.name).path
 
-        files = list(latest_month.glob("*.xlsx"))
+        with os.scandir(latest_month) as it:
+            files = [
+                e for e in it
+                if e.name.endswith(".xlsx") and not e.name.startswith(".") and e.is_file()
+            ]
         if not files:
             raise CommandError(f"No Excel files found in {latest_month}")
-        latest_file = max(files, key=lambda f: f.stat().st_mtime)
+        latest_file = max(files, key=lambda e: e.stat().st_mtime)
+
+        return Path(latest_file.path)
 
-        return latest_file
+    def _text_column(self, df: pd.DataFrame, name: str) -> pd.Series:
+        """Return a column as stripped strings ("" for missing column or NaN)."""
+        if name not in df.columns:
+            return pd.Series("", index=df.index)
+        return df[name].fillna("").astype(str).str.strip()
 
-    def _is_valid_row(self, row_dict: dict) -> bool:
+    def _valid_mask(self, df: pd.DataFrame) -> pd.Series:
         """A row is valid only if Part Number and Description/Beschreibung are present."""
-        part_number = str(row_dict.get("Part Number", "") or "").strip()
-        description = (
-            str(row_dict.get("Description", "") or row_dict.get("Beschreibung", "") or "").strip()
-        )
-        return bool(part_number and description)
+        part_number = self._text_column(df, "Part Number")
+        description = self._text_column(df, "Description")
+        description = description.where(description != "", self._text_column(df, "Beschreibung"))
+        return (part_number != "") & (description != "")
+
+    def _clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replace NaN/inf with None so JSON is valid for Postgres."""
+        df = df.replace([np.inf, -np.inf], np.nan)
+        return df.astype(object).where(df.notna(), None)
+
+    def _iter_valid_batches(self, file_path: Path, stats: dict) -> Iterator[pd.DataFrame]:
+        """
+        Stream the sheet in batches and yield the cleaned valid rows of each.
+
+        Row counts are accumulated in stats["total"] and stats["valid"].
+        """
+        for df in iter_excel_batches(file_path, batch_size=PARSE_BATCH_SIZE):
+            # Clean NaN/inf of the valid rows in one vectorized pass (jsonb rejects NaN)
+            valid_df = self._clean_frame(df[self._valid_mask(df)])
+            stats["total"] += len(df)
+            stats["valid"] += len(valid_df)
+            yield valid_df
+
+    def _iter_payload_rows(
+        self, file_path: Path, stats: dict
+    ) -> Iterator[Tuple[int, dict[str, Any]]]:
+        """Yield (line_number, payload) for every valid row, batch by batch."""
+        for valid_df in self._iter_valid_batches(file_path, stats):
+            columns = valid_df.columns.tolist()
+            # Build payloads straight from the object array instead of a Series per row
+            values = valid_df.to_numpy(dtype=object)
+            line_numbers = (valid_df.index.to_numpy() + 1).tolist()
+            for line_number, row_values in zip(line_numbers, values):
+                yield line_number, dict(zip(columns, row_values))
 
-    @transaction.atomic
     def handle(self, *args, **options) -> None:
         supplier_code: str = options["supplier"]
         file_override: str = options["file"]
         dry_run: bool = options["dry_run"]
 
+        run: ImportRun | None = None
+
         try:
-            try:
-                supplier = Supplier.objects.get(supplier_code=supplier_code)
-            except Supplier.DoesNotExist:
+            supplier = Supplier.objects.only("id").filter(supplier_code=supplier_code).first()
+            if supplier is None:
                 raise CommandError(f"Supplier '{supplier_code}' not found")
 
             try:
-                source_type = ImportSourceType.objects.get(code="file")
+                source_type = get_source_type("file")
             except ImportSourceType.DoesNotExist:
                 raise CommandError("ImportSourceType 'file' not found")
 
@@ -146,29 +197,23 @@ By default, --supplier defaults to 70002 and the command looks in:
 
             self.stdout.write(f"Using file: {file_path}")
 
-            df = pd.read_excel(file_path)
-            total = len(df)
-            self.stdout.write(f"Found {total} rows in Excel.")
+            stats = {"total": 0, "valid": 0}
 
             # ---------------- DRY-RUN ----------------
             if dry_run:
                 self.stdout.write(self.style.WARNING("[DRY-RUN] No DB changes."))
 
                 max_preview = 20
-                preview_rows = []
-                skipped = 0
-                valid = 0
-
-                for i, row in df.iterrows():
-                    row_dict = row.to_dict()
-                    if not self._is_valid_row(row_dict):
-                        skipped += 1
-                        continue
+                preview_rows: list[tuple[int, dict]] = []
+                for valid_df in self._iter_valid_batches(file_path, stats):
                     if len(preview_rows) < max_preview:
-                        preview_rows.append((i + 1, row_dict))
-                    valid += 1
-                    if len(preview_rows) >= max_preview:
-                        break
+                        preview_df = valid_df.head(max_preview - len(preview_rows))
+                        preview_rows.extend(
+                            zip(preview_df.index + 1, preview_df.to_dict(orient="records"))
+                        )
+
+                total, valid = stats["total"], stats["valid"]
+                self.stdout.write(f"Found {total} rows in Excel.")
 
                 for line_no, row_dict in preview_rows:
                     self.stdout.write(f"Line {line_no}: {row_dict}")
@@ -180,61 +225,59 @@ By default, --supplier defaults to 70002 and the command looks in:
                     )
 
                 self.stdout.write(
-                    f"Total rows = {total}, skipped invalid = {skipped}, valid = {valid}"
+                    f"Total rows = {total}, skipped invalid = {total - valid}, valid = {valid}"
                 )
                 return
 
             # ---------------- REAL IMPORT ----------------
+            # Created outside the ingest transaction so a failed run stays visible
             run = ImportRun.objects.create(
                 supplier=supplier,
                 source_type=source_type,
                 source_file=str(file_path),
                 started_at=timezone.now(),
-                status="running",
+                status=ImportRun.Status.RUNNING,
             )
 
-            batch_size = 5000
-            buffer: list[ImportRawRecord] = []
-            skipped = 0
-            inserted = 0
-
-            for i, row in df.iterrows():
-                row_dict = row.to_dict()
-                if not self._is_valid_row(row_dict):
-                    skipped += 1
-                    continue
-
-                buffer.append(
-                    ImportRawRecord(
-                        import_run=run,
-                        line_number=i + 1,
-                        payload=row_dict,
-                    )
+            # Only the ingest needs atomicity; lookups and the dry run run without a transaction
+            with transaction.atomic():
+                # Rows of a fresh run are not read until normalize_records, so the
+                # bulk load does not need to wait for WAL flushes on commit.
+                if connection.vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL synchronous_commit = off")
+
+                # COPY on PostgreSQL, bulk_create elsewhere. The reader still loads the
+                # sheet's cell values; only DataFrames and payload dicts are built per batch.
+                inserted = bulk_insert_raw_records(run, self._iter_payload_rows(file_path, stats))
+
+                total = stats["total"]
+                skipped = total - inserted
+                self.stdout.write(f"Found {total} rows in Excel.")
+
+                # Single UPDATE of the three columns instead of a full-row save()
+                ImportRun.objects.filter(pk=run.pk).update(
+                    finished_at=timezone.now(),
+                    total_records=inserted,
+                    status=ImportRun.Status.SUCCESS,
                 )
 
-                if len(buffer) >= batch_size:
-                    ImportRawRecord.objects.bulk_create(buffer, batch_size)
-                    inserted += len(buffer)
-                    buffer.clear()
-                    self.stdout.write(f"Inserted {inserted} rows...")
-
-            if buffer:
-                ImportRawRecord.objects.bulk_create(buffer, batch_size)
-                inserted += len(buffer)
-
-            run.finished_at = timezone.now()
-            run.total_records = inserted
-            run.status = "success"
-            run.save()
-
             self.stdout.write(
                 self.style.SUCCESS(
                     f"ImportRun {run.id} complete — {inserted} rows imported "
-                    f"(skipped {skipped} invalid rows, batch size {batch_size})."
+                    f"(skipped {skipped} invalid rows)."
                 )
             )
 
+        except CommandError:
+            raise
         except Exception as e:
-            tb = traceback.format_exc()
-            logger.error(f"Komatsu import failed: {e}")
-            raise CommandError(f"Error during import: {e}\n{tb}")
+            logger.exception("Komatsu import failed")
+            if run is not None:
+                ImportRun.objects.filter(pk=run.pk, status=ImportRun.Status.RUNNING).update(
+                    status=ImportRun.Status.FAILED, finished_at=timezone.now()
+                )
+            raise CommandError(f"Error during import: {e}") from e
+
+        # Refresh planner statistics after the committed bulk load (best effort)
+        analyze_raw_records()
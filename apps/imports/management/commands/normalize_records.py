@@ -21,24 +21,31 @@ Behavior:
         * Normalizes all ImportRawRecords with `normalized_data IS NULL` in batches.
     - Loads defaults first, then applies supplier mapping (overwriting).
     - Logs processed counts (success vs. error).
+    - On PostgreSQL, results are COPYed into a temporary staging table and written
+      back with a single UPDATE ... FROM per batch (temp tables skip WAL).
+      Other backends fall back to bulk_update.
 """
 
 from __future__ import annotations
 
+import json
 import logging
-import traceback
+from itertools import islice
+
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 
 from apps.imports.models.import_run import ImportRun
 from apps.imports.models.import_raw_record import ImportRawRecord
-from apps.imports.models.import_map_set import ImportMapSet
 from apps.partners.models.supplier import Supplier
-from apps.imports.services.mapping_engine import apply_mapping
-from apps.imports.services.merge_defaults import load_defaults
+from apps.imports.services.config_cache import get_newest_map_set
+from apps.imports.services.mapping_engine import apply_mapping, apply_mapping_many, to_json_text
+from apps.imports.services.merge_defaults import merge_defaults
 
 logger = logging.getLogger(__name__)
 
+STAGE_TABLE = "norm_stage"
+
 
 class Command(BaseCommand):
     help = "Normalize ImportRawRecords for a supplier (or specific ImportRun)."
@@ -54,6 +61,40 @@ class Command(BaseCommand):
             help="Optional: reprocess this specific ImportRun id instead of supplier-wide processing.",
         )
 
+    def _ensure_stage_table(self, cursor) -> None:
+        """Create the session-scoped staging table for normalized results."""
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} "
+            f"(id bigint PRIMARY KEY, nd jsonb, err text)"
+        )
+
+    def _flush(self, cursor, rows: list[tuple]) -> None:
+        """COPY a batch of (id, normalized_json, error) into staging and apply it."""
+        table = ImportRawRecord._meta.db_table
+        with cursor.copy(f"COPY {STAGE_TABLE} (id, nd, err) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+        cursor.execute(
+            f"UPDATE {table} r "
+            f"SET normalized_data = s.nd, error_message_product_import = s.err "
+            f"FROM {STAGE_TABLE} s WHERE r.id = s.id"
+        )
+        cursor.execute(f"TRUNCATE {STAGE_TABLE}")
+
+    def _bulk_update(self, rows: list[tuple]) -> None:
+        """Fallback for non-PostgreSQL backends: bulk_update the batch."""
+        ImportRawRecord.objects.bulk_update(
+            [
+                ImportRawRecord(
+                    id=rec_id,
+                    normalized_data=None if nd is None else json.loads(nd),
+                    error_message_product_import=err,
+                )
+                for rec_id, nd, err in rows
+            ],
+            ["normalized_data", "error_message_product_import"],
+        )
+
     @transaction.atomic
     def handle(self, *args, **options):
         run_id = options.get("run_id")
@@ -61,7 +102,7 @@ class Command(BaseCommand):
 
         if run_id:
             try:
-                run = ImportRun.objects.get(id=run_id)
+                run = ImportRun.objects.select_related("supplier", "source_type").get(id=run_id)
             except ImportRun.DoesNotExist:
                 raise CommandError(f"ImportRun {run_id} not found")
 
@@ -80,25 +121,21 @@ class Command(BaseCommand):
             except Supplier.DoesNotExist:
                 raise CommandError(f"Supplier '{supplier_code}' not found")
 
-            runs = ImportRun.objects.filter(supplier=supplier, map_set__isnull=True)
+            runs = ImportRun.objects.filter(
+                supplier=supplier, map_set__isnull=True
+            ).select_related("supplier", "source_type")
             if not runs.exists():
                 self.stdout.write(self.style.WARNING("No ImportRuns without map_set found."))
                 return
 
+        use_copy = connection.vendor == "postgresql"
         total_runs = 0
         total_success = 0
         total_errors = 0
 
         for run in runs:
-            # find newest mapping for this supplier + source_type
-            map_set = (
-                ImportMapSet.objects.filter(
-                    supplier=run.supplier,
-                    source_type=run.source_type,
-                )
-                .order_by("-valid_from")
-                .first()
-            )
+            # find newest mapping for this supplier + source_type (cached per process)
+            map_set = get_newest_map_set(run.supplier_id, run.source_type_id)
 
             if not map_set:
                 raise CommandError(
@@ -112,45 +149,52 @@ class Command(BaseCommand):
             # process raw records
             raw_records = ImportRawRecord.objects.filter(
                 import_run=run, normalized_data__isnull=True
-            )
+            ).values_list("id", "payload")
 
-            batch_size = 1000
-            buffer = []
+            batch_size = 2000
+            buffer: list[tuple] = []
             success_count = 0
             error_count = 0
 
-            for rec in raw_records.iterator():
-                try:
-                    # load defaults first
-                    normalized = load_defaults(map_set.organization)
-
-                    # apply supplier mapping and overwrite defaults
-                    mapped = apply_mapping(rec.payload, map_set)
-                    normalized.update(mapped)
-
-                    rec.normalized_data = normalized
-                    rec.error_message_product_import = None
-                    success_count += 1
-                except Exception as e:
-                    tb = traceback.format_exc()
-                    logger.error(
-                        f"Normalization failed for ImportRawRecord {rec.id}: {e}\n{tb}"
-                    )
-                    rec.error_message_product_import = f"Normalization error: {e}"
-                    error_count += 1
-                buffer.append(rec)
-
-                if len(buffer) >= batch_size:
-                    ImportRawRecord.objects.bulk_update(
-                        buffer, ["normalized_data", "error_message_product_import"]
-                    )
+            with connection.cursor() as cursor:
+                if use_copy:
+                    self._ensure_stage_table(cursor)
+
+                records = raw_records.iterator(chunk_size=batch_size)
+                while chunk := list(islice(records, batch_size)):
+                    try:
+                        # map the whole chunk column by column
+                        mapped_rows = apply_mapping_many(
+                            [payload for _, payload in chunk], map_set, json_safe=False
+                        )
+                    except Exception:
+                        # map record by record so failing records are reported individually
+                        mapped_rows = None
+
+                    for idx, (rec_id, payload) in enumerate(chunk):
+                        try:
+                            if mapped_rows is not None:
+                                mapped = mapped_rows[idx]
+                            else:
+                                mapped = apply_mapping(payload, map_set, json_safe=False)
+
+                            # defaults first, supplier mapping overwrites them
+                            normalized = merge_defaults(mapped, map_set.organization)
+
+                            buffer.append((rec_id, to_json_text(normalized), None))
+                            success_count += 1
+                        except Exception as e:
+                            # Lazy %-formatting; the traceback is only rendered if the record is emitted
+                            logger.exception("Normalization failed for ImportRawRecord %s", rec_id)
+                            buffer.append((rec_id, None, f"Normalization error: {e}"))
+                            error_count += 1
+
+                    if use_copy:
+                        self._flush(cursor, buffer)
+                    else:
+                        self._bulk_update(buffer)
                     buffer.clear()
 
-            if buffer:
-                ImportRawRecord.objects.bulk_update(
-                    buffer, ["normalized_data", "error_message_product_import"]
-                )
-
             total_runs += 1
             total_success += success_count
             total_errors += error_count
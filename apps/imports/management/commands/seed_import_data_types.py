@@ -29,6 +29,7 @@ from __future__ import annotations
 
 from django.core.management.base import BaseCommand
 from apps.imports.models.import_data_type import ImportDataType
+from apps.imports.services.lookups import clear_lookup_cache
 
 
 class Command(BaseCommand):
@@ -38,27 +39,33 @@ class Command(BaseCommand):
 
     help = "Seed ImportDataType with default values (idempotent)."
 
-    DEFAULT_TYPES = [
+    DEFAULT_TYPES = (
         ("str", "String"),
         ("int", "Integer"),
         ("decimal", "Decimal number"),
         ("bool", "Boolean"),
         ("date", "Date"),
         ("datetime", "Date and time"),
-    ]
+    )
 
     def handle(self, *args, **options) -> None:
+        existing = set(ImportDataType.objects.values_list("code", flat=True))
+        ImportDataType.objects.bulk_create(
+            [ImportDataType(code=code, description=desc) for code, desc in self.DEFAULT_TYPES],
+            update_conflicts=True,
+            unique_fields=["code"],
+            update_fields=["description"],
+        )
+        # bulk_create sends no post_save, so drop cached code -> id lookups explicitly
+        clear_lookup_cache()
+
         created_count = 0
-        for code, desc in self.DEFAULT_TYPES:
-            obj, created = ImportDataType.objects.get_or_create(
-                code=code,
-                defaults={"description": desc},
-            )
-            if created:
+        for code, _ in self.DEFAULT_TYPES:
+            if code in existing:
+                self.stdout.write(f"Exists: {code}")
+            else:
                 created_count += 1
                 self.stdout.write(self.style.SUCCESS(f"Created ImportDataType: {code}"))
-            else:
-                self.stdout.write(f"Exists: {code}")
 
         self.stdout.write(
             self.style.SUCCESS(f"Seeding complete. {created_count} new datatypes added.")
@@ -86,12 +86,13 @@ class Command(BaseCommand):
 
         # 3. Seed ausführen (idempotent)
         default_set, created = ops.seed_initial_defaults(org, valid_from)
+        line_count = default_set.global_default_lines.count()
 
         if created:
             self.stdout.write(
                 self.style.SUCCESS(
                     f"✅ Created ImportGlobalDefaultSet {default_set.id} "
-                    f"with {default_set.global_default_lines.count()} lines "
+                    f"with {line_count} lines "
                     f"(valid_from={valid_from}, org={org.pk})."
                 )
             )
@@ -99,7 +100,7 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.WARNING(
                     f"⚠ Using existing ImportGlobalDefaultSet {default_set.id} "
-                    f"with {default_set.global_default_lines.count()} lines "
+                    f"with {line_count} lines "
                     f"(valid_from={valid_from}, org={org.pk})."
                 )
             )
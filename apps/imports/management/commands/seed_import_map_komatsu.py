@@ -24,10 +24,25 @@ from apps.imports.models.import_map_set import ImportMapSet
 from apps.imports.models.import_map_detail import ImportMapDetail
 from apps.imports.models.import_data_type import ImportDataType
 from apps.imports.models.import_source_type import ImportSourceType
+from apps.imports.services.config_cache import bump_config_version
+from apps.imports.services.lookups import get_source_type
 from apps.partners.models.supplier import Supplier
 from apps.core.models.organization import Organization
 
 
+# Mapping rules (Komatsu-specific fields):
+# (source_path, target_path, datatype_code, is_required, transform)
+KOMATSU_MAPPINGS = (
+    ("Part Number", "product.productNumber", "str", True, None),
+    ("Beschreibung", "product.name", "str", True, None),
+    ("Listenpreis", "price.price", "decimal", True, "decimal"),
+    ("Returnable Y/N", "variant.is_returnable", "bool", False, "bool"),
+    ("Weight in gramms", "variant.weight", "decimal", False, "decimal"),
+    ("Customs Commodity Code", "variant.customs_code", "str", False, None),
+)
+KOMATSU_DATATYPE_CODES = frozenset(m[2] for m in KOMATSU_MAPPINGS)
+
+
 class Command(BaseCommand):
     help = "Seed ImportMapSet + ImportMapDetails for Komatsu supplier."
 
@@ -53,7 +68,7 @@ class Command(BaseCommand):
             raise CommandError(f"Organization {org_id} not found")
 
         try:
-            source_type = ImportSourceType.objects.get(code="file")
+            source_type = get_source_type("file")
         except ImportSourceType.DoesNotExist:
             raise CommandError("ImportSourceType 'file' not found")
 
@@ -71,31 +86,35 @@ class Command(BaseCommand):
             )
         )
 
-        # Helpers
-        def dt(code: str) -> ImportDataType:
-            return ImportDataType.objects.get(code=code)
-
-        # Mapping rules (Komatsu-specific fields)
-        mappings = [
-            ("Part Number", "product.productNumber", "str", True, None),
-            ("Beschreibung", "product.name", "str", True, None),
-            ("Listenpreis", "price.price", "decimal", True, "decimal"),
-            ("Returnable Y/N", "variant.is_returnable", "bool", False, "bool"),
-            ("Weight in gramms", "variant.weight", "decimal", False, "decimal"),
-            ("Customs Commodity Code", "variant.customs_code", "str", False, None),
-        ]
-
-        for source, target, dtype, required, transform in mappings:
-            detail, _ = ImportMapDetail.objects.update_or_create(
+        # Load all needed datatypes in one query
+        dt_map = {
+            d.code: d for d in ImportDataType.objects.filter(code__in=KOMATSU_DATATYPE_CODES)
+        }
+        missing = KOMATSU_DATATYPE_CODES - dt_map.keys()
+        if missing:
+            raise CommandError(f"ImportDataType not found: {', '.join(sorted(missing))}")
+
+        # Upsert all details in one INSERT ... ON CONFLICT DO UPDATE
+        details = [
+            ImportMapDetail(
                 map_set=map_set,
                 source_path=source,
                 target_path=target,
-                defaults={
-                    "target_datatype": dt(dtype),
-                    "is_required": required,
-                    "transform": transform,
-                },
+                target_datatype=dt_map[dtype],
+                is_required=required,
+                transform=transform,
             )
+            for source, target, dtype, required, transform in KOMATSU_MAPPINGS
+        ]
+        ImportMapDetail.objects.bulk_create(
+            details,
+            update_conflicts=True,
+            unique_fields=["map_set", "source_path", "target_path"],
+            update_fields=["target_datatype", "is_required", "transform"],
+        )
+        # bulk_create sends no post_save, so drop cached configuration explicitly
+        bump_config_version()
+        for source, target, dtype, _, _ in KOMATSU_MAPPINGS:
             self.stdout.write(f"  Mapping {source} → {target} ({dtype})")
 
         self.stdout.write(self.style.SUCCESS("Komatsu mapping seeded successfully."))
@@ -30,25 +30,34 @@ from __future__ import annotations
 from django.core.management.base import BaseCommand
 from django.apps import apps
 
+from apps.imports.services.lookups import clear_lookup_cache
+
 
 class Command(BaseCommand):
     help = "Seed default ImportSourceType records (idempotent)."
 
-    DEFAULTS = [
+    DEFAULTS = (
         ("file", "Flat file import (CSV, XLSX, etc.)"),
         ("api", "API-based import"),
         ("manual", "Manual user input"),
         ("other", "Other or unspecified source"),
-    ]
+    )
 
     def handle(self, *args, **options):
         ImportSourceType = apps.get_model("imports", "ImportSourceType")
 
-        for code, desc in self.DEFAULTS:
-            obj, created = ImportSourceType.objects.get_or_create(
-                code=code, defaults={"description": desc}
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"Created: {code}"))
-            else:
+        existing = set(ImportSourceType.objects.values_list("code", flat=True))
+        ImportSourceType.objects.bulk_create(
+            [ImportSourceType(code=code, description=desc) for code, desc in self.DEFAULTS],
+            update_conflicts=True,
+            unique_fields=["code"],
+            update_fields=["description"],
+        )
+        # bulk_create sends no post_save, so drop cached source types explicitly
+        clear_lookup_cache()
+
+        for code, _ in self.DEFAULTS:
+            if code in existing:
                 self.stdout.write(f"Exists: {code}")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Created: {code}"))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0005_importrawrecord_normalized_data'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='importerrorlog',
+            index=models.Index(fields=['import_run', 'line_number'], name='idx_errorlog_run_line'),
+        ),
+        migrations.AddIndex(
+            model_name='importerrorlog',
+            index=models.Index(fields=['created_at'], name='idx_errorlog_created'),
+        ),
+    ]
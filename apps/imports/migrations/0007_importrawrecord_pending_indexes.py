@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0006_importerrorlog_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='importrawrecord',
+            name='idx_rawrecord_product_imported',
+        ),
+        migrations.RemoveIndex(
+            model_name='importrawrecord',
+            name='idx_rawrecord_price_imported',
+        ),
+        migrations.AddIndex(
+            model_name='importrawrecord',
+            index=models.Index(condition=models.Q(('is_product_import_error', False), ('product_is_imported', False)), fields=['import_run', 'line_number'], name='idx_rr_prod_pending'),
+        ),
+        migrations.AddIndex(
+            model_name='importrawrecord',
+            index=models.Index(condition=models.Q(('is_price_import_error', False), ('price_is_imported', False)), fields=['import_run', 'line_number'], name='idx_rr_price_pending'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0007_importrawrecord_pending_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importrawrecord',
+            name='line_number',
+            field=models.PositiveIntegerField(help_text='Sequential line number within the import run (starting at 1).'),
+        ),
+        migrations.AddConstraint(
+            model_name='importrawrecord',
+            constraint=models.CheckConstraint(condition=models.Q(('line_number__gte', 1)), name='ck_rr_line_pos'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:34
+
+import apps.imports.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0008_importrawrecord_line_number_positive'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importrawrecord',
+            name='payload',
+            field=apps.imports.models.fields.FastJSONField(help_text='Full raw payload from the external source (JSON or converted dict).'),
+        ),
+    ]
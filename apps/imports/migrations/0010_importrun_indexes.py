@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0009_importrawrecord_payload_fastjson'),
+        ('partners', '0003_supplier_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='importrun',
+            index=models.Index(fields=['supplier', '-started_at'], name='idx_importrun_supp_started'),
+        ),
+        migrations.AddIndex(
+            model_name='importrun',
+            index=models.Index(condition=models.Q(('is_processed', False)), fields=['started_at'], name='idx_importrun_pending'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0010_importrun_indexes'),
+        ('partners', '0003_supplier_comment'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importrun',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('success', 'Success'), ('failed', 'Failed')], default='running', help_text='running, success, failed', max_length=10),
+        ),
+        migrations.AddConstraint(
+            model_name='importrun',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['running', 'success', 'failed'])), name='ck_importrun_status'),
+        ),
+    ]
@@ -63,6 +63,10 @@ class ImportErrorLog(models.Model):
     class Meta:
         verbose_name = "Import Error Log"
         verbose_name_plural = "Import Error Logs"
+        indexes = [
+            models.Index(fields=["import_run", "line_number"], name="idx_errorlog_run_line"),
+            models.Index(fields=["created_at"], name="idx_errorlog_created"),
+        ]
 
     def __str__(self) -> str:
         return f"Error in run {self.import_run_id} line {self.line_number}: {self.error_message}"
@@ -8,11 +8,14 @@ Context:
     Belongs to the imports domain. Each ImportRawRecord links to an ImportRun
     and captures a single line/item from the input (JSON, XML, CSV, etc.).
     Used for auditing, debugging, error handling, and retries.
+    A run can hold hundreds of thousands of records: loops over the records
+    of a run stream them with `.values_list(...).iterator(chunk_size=...)`
+    (server-side cursor on PostgreSQL) instead of materializing a queryset.
 
 Fields:
     - import_run (FK → ImportRun): The import run this record belongs to.
-    - line_number (IntegerField): Sequential number within the run (starting at 1).
-    - payload (JSONField): Full raw payload from the external source.
+    - line_number (PositiveIntegerField): Sequential number within the run (starting at 1).
+    - payload (FastJSONField): Full raw payload from the external source (orjson-decoded).
     - supplier_product_reference (CharField, 255, optional): Supplier’s identifier
       (SKU, part number) for fast lookup.
     - product_is_imported / price_is_imported (BooleanField): Flags whether
@@ -52,8 +55,11 @@ Example:
 
 from __future__ import annotations
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
+from apps.imports.models.fields import FastJSONField
+
 
 class ImportRawRecord(models.Model):
     """
@@ -68,11 +74,11 @@ class ImportRawRecord(models.Model):
         help_text="Import run this record belongs to.",
     )
 
-    line_number = models.IntegerField(
+    line_number = models.PositiveIntegerField(
         help_text="Sequential line number within the import run (starting at 1)."
     )
 
-    payload = models.JSONField(
+    payload = FastJSONField(
         help_text="Full raw payload from the external source (JSON or converted dict)."
     )
 
@@ -154,12 +160,26 @@ class ImportRawRecord(models.Model):
             models.UniqueConstraint(
                 fields=["import_run", "line_number"],
                 name="uniq_import_run_line",
-            )
+            ),
+            models.CheckConstraint(
+                condition=Q(line_number__gte=1),
+                name="ck_rr_line_pos",
+            ),
         ]
         indexes = [
         #     models.Index(fields=["supplier_product_reference"], name="idx_rawrecord_supplier_ref"),
-              models.Index(fields=["product_is_imported"], name="idx_rawrecord_product_imported"),
-              models.Index(fields=["price_is_imported"], name="idx_rawrecord_price_imported"),
+            # Partial indexes: only the rows still waiting for product/price import,
+            # ordered per run, instead of a full index over a two-valued flag
+            models.Index(
+                fields=["import_run", "line_number"],
+                name="idx_rr_prod_pending",
+                condition=Q(product_is_imported=False, is_product_import_error=False),
+            ),
+            models.Index(
+                fields=["import_run", "line_number"],
+                name="idx_rr_price_pending",
+                condition=Q(price_is_imported=False, is_price_import_error=False),
+            ),
         #     models.Index(fields=["is_product_import_error"], name="idx_rawrecord_product_error"),
         #     models.Index(fields=["is_price_import_error"], name="idx_rawrecord_price_error"),
         #     models.Index(fields=["product_is_imported", "import_run_id"], name="idx_rawrecord_product_imported_run),"
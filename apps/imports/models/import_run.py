@@ -15,7 +15,7 @@ Fields:
     - source_file (CharField, 500, optional): Path or identifier of the imported file.
     - started_at (DateTimeField): Timestamp when the import started.
     - finished_at (DateTimeField, optional): Timestamp when the import finished.
-    - status (CharField, 20): Run status ("running", "success", "failed").
+    - status (CharField, 10, ImportRun.Status): Run status ("running", "success", "failed").
     - total_records (IntegerField, optional): Number of raw records fetched.
     - is_processed (BooleanField): Whether the run has been processed into ERP tables.
     - processed_at (DateTimeField, optional): Timestamp when records were processed.
@@ -47,17 +47,30 @@ Example:
 
 from __future__ import annotations
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 from apps.imports.models.import_map_set import ImportMapSet
 
 
+class ImportRunManager(models.Manager):
+    """Default manager: joins supplier and source_type, which __str__ and list views read."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("supplier", "source_type")
+
+
 class ImportRun(models.Model):
     """
     Represents a single supplier import execution (the header).
     Tracks metadata and overall status of the import process.
     """
 
+    class Status(models.TextChoices):
+        RUNNING = "running", "Running"
+        SUCCESS = "success", "Success"
+        FAILED = "failed", "Failed"
+
     supplier = models.ForeignKey(
         "partners.Supplier",
         on_delete=models.PROTECT,
@@ -82,8 +95,9 @@ class ImportRun(models.Model):
     started_at = models.DateTimeField(default=timezone.now)
     finished_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(
-        max_length=20,
-        default="running",
+        max_length=10,
+        choices=Status.choices,
+        default=Status.RUNNING,
         help_text="running, success, failed"
     )
     total_records = models.IntegerField(
@@ -111,9 +125,28 @@ class ImportRun(models.Model):
         help_text="The mapping set that was applied for this import run."
     )
 
+    objects = ImportRunManager()
+
     class Meta:
         verbose_name = "Import Run"
         verbose_name_plural = "Import Runs"
+        indexes = [
+            # Run history per supplier (admin lists, "latest run" lookups)
+            models.Index(fields=["supplier", "-started_at"], name="idx_importrun_supp_started"),
+            # Polling for unprocessed runs (oldest first); only the few runs not
+            # yet processed into ERP tables are indexed
+            models.Index(
+                fields=["started_at"],
+                condition=Q(is_processed=False),
+                name="idx_importrun_pending",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(status__in=["running", "success", "failed"]),
+                name="ck_importrun_status",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"ImportRun {self.id} — {self.supplier.supplier_code} at {self.started_at:%Y-%m-%d %H:%M}"
@@ -0,0 +1,104 @@
+# apps/imports/services/config_cache.py
+"""
+Purpose:
+    Versioned in-process cache for import configuration lookups
+    (active ImportGlobalDefaultSet per organization, newest ImportMapSet per
+    supplier + source type).
+
+Context:
+    Part of the `apps.imports.services` package.
+    Configuration rows change rarely but are resolved for every import run
+    or raw record. Results are cached per process and keyed on a version
+    counter that is bumped by post_save/post_delete signals of the
+    configuration models, so admin changes invalidate the cache without a
+    restart. Bulk upserts send no signals; the seed paths that use them call
+    bump_config_version() themselves.
+
+Used by:
+    - apps/imports/services/defaults.py
+    - apps/imports/services/merge_defaults.py
+    - apps/imports/services/mapping_engine.py
+    - apps/imports/management/commands/normalize_records.py
+    - apps/imports/management/commands/seed_import_map_komatsu.py
+    - apps/imports/services/import_defaults_ops.py
+    - apps/imports/apps.py (connects the invalidation signals)
+
+Depends on:
+    - apps.imports.models.import_global_default_set.ImportGlobalDefaultSet
+    - apps.imports.models.import_global_default_line.ImportGlobalDefaultLine
+    - apps.imports.models.import_map_set.ImportMapSet
+    - apps.imports.models.import_map_detail.ImportMapDetail
+
+Example:
+    from apps.imports.services.config_cache import get_active_default_set
+
+    default_set = get_active_default_set(org_id=1)
+"""
+
+
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from apps.imports.models.import_global_default_line import ImportGlobalDefaultLine
+from apps.imports.models.import_global_default_set import ImportGlobalDefaultSet
+from apps.imports.models.import_map_detail import ImportMapDetail
+from apps.imports.models.import_map_set import ImportMapSet
+
+# Models whose changes invalidate every cached configuration lookup
+CONFIG_MODELS = (ImportGlobalDefaultSet, ImportGlobalDefaultLine, ImportMapSet, ImportMapDetail)
+
+_version = 0
+
+
+def config_version() -> int:
+    """Return the current configuration version (part of every cache key)."""
+    return _version
+
+
+def bump_config_version(**kwargs) -> None:
+    """Invalidate all cached configuration lookups (also used as signal receiver)."""
+    global _version
+    _version += 1
+
+
+def connect_signals() -> None:
+    """Bump the version whenever a configuration model is saved or deleted."""
+    for model in CONFIG_MODELS:
+        uid = f"config_cache_{model._meta.label_lower}"
+        post_save.connect(bump_config_version, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(bump_config_version, sender=model, dispatch_uid=f"{uid}_delete")
+
+
+@lru_cache(maxsize=1024)
+def _active_default_set(org_id: int, day: date, version: int) -> Optional[ImportGlobalDefaultSet]:
+    return (
+        ImportGlobalDefaultSet.objects.filter(organization_id=org_id, valid_from__lte=day)
+        .order_by("-valid_from")
+        .first()
+    )
+
+
+def get_active_default_set(org_id: int) -> Optional[ImportGlobalDefaultSet]:
+    """Return the ImportGlobalDefaultSet valid today for an organization (cached)."""
+    return _active_default_set(org_id, timezone.localdate(), _version)
+
+
+@lru_cache(maxsize=1024)
+def _newest_map_set(supplier_id: int, source_type_id: int, version: int) -> Optional[ImportMapSet]:
+    return (
+        ImportMapSet.objects.filter(supplier_id=supplier_id, source_type_id=source_type_id)
+        .select_related("organization")
+        .order_by("-valid_from")
+        .first()
+    )
+
+
+def get_newest_map_set(supplier_id: int, source_type_id: int) -> Optional[ImportMapSet]:
+    """Return the newest ImportMapSet for a supplier + source type (cached)."""
+    return _newest_map_set(supplier_id, source_type_id, _version)
@@ -11,12 +11,13 @@ Context:
 
 Used by:
     - Import pipelines and services that need a ready-to-use defaults dictionary
-    - Local testing (via __main__ execution)
+    - Local testing (via `python -m apps.imports.services.defaults`)
 
 Depends on:
     - apps.imports.models.import_global_default_set.ImportGlobalDefaultSet
-    - Django ORM for querying active default sets
-    - django.utils.timezone for date comparison
+    - apps.imports.models.import_global_default_line.ImportGlobalDefaultLine
+    - apps.imports.services.config_cache for the cached active set lookup
+      and the version that invalidates cached base dicts
 
 Example:
     from apps.imports.services.defaults import build_base_dict
@@ -28,26 +29,58 @@ Example:
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-import scripts.bootstrap_django  # noqa: F401
+if __name__ == "__main__":
+    # Standalone run (python -m apps.imports.services.defaults): set up Django
+    # before the model imports below. Importers of this module are already configured.
+    import scripts.bootstrap_django  # noqa: F401
 
-from django.utils import timezone
+from apps.imports.models.import_global_default_line import ImportGlobalDefaultLine
 from apps.imports.models.import_global_default_set import ImportGlobalDefaultSet
+from apps.imports.services import config_cache
 
 
 def get_active_default_set(org_id: int) -> ImportGlobalDefaultSet:
     """
     Return the active ImportGlobalDefaultSet for an organization, based on valid_from.
+
+    Resolved through the versioned in-process cache (services.config_cache).
     """
-    return (
-        ImportGlobalDefaultSet.objects.filter(organization_id=org_id, valid_from__lte=timezone.now())
-        .order_by("-valid_from")
-        .first()
+    return config_cache.get_active_default_set(org_id)
+
+
+@lru_cache(maxsize=64)
+def _build_from_set_id(set_id: int, version: int) -> Mapping[str, Mapping[str, Any]]:
+    """Group the lines of one default set into section subdicts (cached per config version)."""
+    base: Dict[str, Dict[str, Any]] = {
+        "product": {},
+        "variant": {},
+        "price": {},
+        "supplier": {},
+        "supplier_product": {},
+    }
+
+    lines = ImportGlobalDefaultLine.objects.filter(set_id=set_id).values_list(
+        "target_path", "default_value"
     )
+    base_setdefault = base.setdefault
+    for target_path, default_value in lines.iterator(chunk_size=200):
+        # Expect target_path like "product.name" or "variant.state_code"
+        head, sep, tail = target_path.partition(".")
+        if sep:
+            section, key = head, tail
+        else:
+            section, key = "product", head
+
+        base_setdefault(section, {})[key] = default_value
+
+    return MappingProxyType({section: MappingProxyType(values) for section, values in base.items()})
 
 
-def build_base_dict(org_id: int) -> Dict[str, Dict[str, Any]]:
+def build_base_dict(org_id: int) -> Mapping[str, Mapping[str, Any]]:
     """
     Build a base dict structure with global defaults, grouped into subdicts.
 
@@ -59,49 +92,28 @@ def build_base_dict(org_id: int) -> Dict[str, Dict[str, Any]]:
         "supplier": {...},
         "supplier_product": {...}
     }
+
+    The grouped lines are cached per (default set, config version) and
+    returned as read-only mappings shared by all callers. Build per-record
+    dicts by merging instead of copying and mutating:
+
+        base = build_base_dict(org_id)
+        product = {**base["product"], **overrides}
     """
 
     default_set = get_active_default_set(org_id)
     if not default_set:
         raise RuntimeError(f"No ImportGlobalDefaultSet found for org_id={org_id}")
 
-    base: Dict[str, Dict[str, Any]] = {
-        "product": {},
-        "variant": {},
-        "price": {},
-        "supplier": {},
-        "supplier_product": {},
-    }
-
-    for line in default_set.global_default_lines.all():
-        # Expect target_path like "product.name" or "variant.state_code"
-        if "." not in line.target_path:
-            section, key = "product", line.target_path
-        else:
-            section, key = line.target_path.split(".", 1)
-
-        if section not in base:
-            base[section] = {}
-
-        base[section][key] = line.default_value
-
-    return base
+    return _build_from_set_id(default_set.pk, config_cache.config_version())
 
 
 # ---------------------------------------------------------------------------
 # Local test runner
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
-    import django
-    import os
-    #import pprint
-    import scripts.bootstrap_django  # noqa: F401
     import pprint
 
-    # 🔌 Bootstrap Django environment
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lnd_manage.settings")
-    django.setup()
-
     ORG_ID = 1
 
     try:
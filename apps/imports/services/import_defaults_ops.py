@@ -19,6 +19,7 @@ Depends on:
     - apps.imports.models.import_global_default_line.ImportGlobalDefaultLine
     - apps.imports.models.import_data_type.ImportDataType
     - apps.core.models.organization.Organization
+    - apps.imports.services.lookups for cached datatype code → id resolution
     - Django transaction management
 
 Example:
@@ -43,6 +44,8 @@ from apps.imports.models.import_global_default_set import ImportGlobalDefaultSet
 from apps.imports.models.import_global_default_line import ImportGlobalDefaultLine
 from apps.imports.models.import_data_type import ImportDataType
 from apps.core.models.organization import Organization
+from apps.imports.services.config_cache import bump_config_version
+from apps.imports.services.lookups import resolve_datatype_id
 
 
 @transaction.atomic
@@ -87,7 +90,7 @@ def add_default_line(
         (ImportGlobalDefaultLine, created: bool)
     """
     try:
-        datatype = ImportDataType.objects.get(code=datatype_code)
+        datatype_id = resolve_datatype_id(datatype_code)
     except ImportDataType.DoesNotExist:
         raise RuntimeError(f"Datatype '{datatype_code}' not found in ImportDataType")
 
@@ -98,7 +101,7 @@ def add_default_line(
             "default_value": default_value,
             "transform": transform,
             "is_required": is_required,
-            "target_datatype": datatype,
+            "target_datatype_id": datatype_id,
         },
     )
     return obj, created
@@ -144,14 +147,31 @@ def seed_initial_defaults(
         {"target_path": "supplier_product.lead_time_days", "default_value": 0, "is_required": True, "datatype_code": "int"},
     ]
 
-    for line in lines:
-        add_default_line(
-            default_set,
-            target_path=line["target_path"],
-            default_value=line.get("default_value"),
-            transform=line.get("transform"),
-            is_required=line.get("is_required", False),
-            datatype_code=line.get("datatype_code", "str"),
-        )
+    datatype_ids: dict[str, int] = {}
+    for code in {line.get("datatype_code", "str") for line in lines}:
+        try:
+            datatype_ids[code] = resolve_datatype_id(code)
+        except ImportDataType.DoesNotExist:
+            raise RuntimeError(f"Datatype '{code}' not found in ImportDataType")
+
+    # One INSERT ... ON CONFLICT DO UPDATE instead of a SELECT + write per line
+    ImportGlobalDefaultLine.objects.bulk_create(
+        [
+            ImportGlobalDefaultLine(
+                set=default_set,
+                target_path=line["target_path"],
+                default_value=line.get("default_value"),
+                transform=line.get("transform"),
+                is_required=line.get("is_required", False),
+                target_datatype_id=datatype_ids[line.get("datatype_code", "str")],
+            )
+            for line in lines
+        ],
+        update_conflicts=True,
+        unique_fields=["set", "target_path"],
+        update_fields=["default_value", "transform", "is_required", "target_datatype"],
+    )
+    # bulk_create sends no post_save, so drop cached configuration explicitly
+    bump_config_version()
 
     return default_set, created
@@ -0,0 +1,96 @@
+# apps/imports/services/lookups.py
+"""
+Purpose:
+    Cached lookups for small, static reference tables of the import app
+    (ImportSourceType, ImportDataType).
+    Saves the repeated SELECT when several imports run in the same process,
+    and resolves codes to primary keys without fetching the FK object.
+
+Context:
+    Part of the `apps.imports.services` package.
+    The cache lives for the lifetime of the process (one management command
+    run, or a worker); reference rows are only changed by the seed commands.
+    post_save/post_delete signals (connected in ImportsConfig.ready) clear it;
+    the seed commands' bulk upserts send no signals and clear it themselves.
+
+Used by:
+    - apps/imports/management/commands/universal_excel_importer.py
+    - apps/imports/management/commands/import_komatsu.py
+    - apps/imports/management/commands/import_elsaesser.py
+    - apps/imports/management/commands/seed_import_map_komatsu.py
+    - apps/imports/services/import_defaults_ops.py
+    - apps/imports/management/commands/seed_import_data_types.py
+    - apps/imports/management/commands/seed_import_source_types.py
+    - apps/imports/apps.py (connects the invalidation signals)
+
+Depends on:
+    - apps.imports.models.import_source_type.ImportSourceType
+    - apps.imports.models.import_data_type.ImportDataType
+
+Example:
+    from apps.imports.services.lookups import get_source_type
+
+    try:
+        source_type = get_source_type("file")
+    except ImportSourceType.DoesNotExist:
+        raise CommandError("ImportSourceType 'file' not found")
+
+    line = ImportGlobalDefaultLine(..., target_datatype_id=resolve_datatype_id("decimal"))
+"""
+
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from apps.imports.models.import_data_type import ImportDataType
+from apps.imports.models.import_source_type import ImportSourceType
+
+# Reference models cached by code; {model: {code: id}} is filled on first use
+CODE_MODELS = (ImportSourceType, ImportDataType)
+_code_ids: dict[type[models.Model], dict[str, int]] = {}
+
+
+@lru_cache(maxsize=8)
+def get_source_type(code: str) -> ImportSourceType:
+    """
+    Return the ImportSourceType with the given code (cached per process).
+
+    Raises:
+        ImportSourceType.DoesNotExist: if no such source type exists
+            (misses are not cached, so a later seed is picked up)
+    """
+    return ImportSourceType.objects.only("id", "code").get(code=code)
+
+
+def _resolve_id(model: type[models.Model], code: str) -> int:
+    """Return the primary key for a reference code; a miss reloads the table once."""
+    ids = _code_ids.get(model)
+    if ids is None or code not in ids:
+        ids = _code_ids[model] = dict(model.objects.values_list("code", "id"))
+    try:
+        return ids[code]
+    except KeyError:
+        raise model.DoesNotExist(f"{model.__name__} '{code}' not found") from None
+
+
+def resolve_datatype_id(code: str) -> int:
+    """Return the ImportDataType id for a code (raises ImportDataType.DoesNotExist)."""
+    return _resolve_id(ImportDataType, code)
+
+
+def clear_lookup_cache(**kwargs) -> None:
+    """Signal receiver: drop all cached reference rows."""
+    _code_ids.clear()
+    get_source_type.cache_clear()
+
+
+def connect_signals() -> None:
+    """Clear the caches whenever a reference row is saved or deleted."""
+    for model in CODE_MODELS:
+        uid = f"lookups_{model._meta.label_lower}"
+        post_save.connect(clear_lookup_cache, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(clear_lookup_cache, sender=model, dispatch_uid=f"{uid}_delete")
@@ -6,19 +6,36 @@ Purpose:
     Apply an ImportMapSet to raw supplier payloads and produce normalized dicts.
     Used by normalize_records and other import processing commands.
 
+    The map details of a set are loaded once per process and kept as a
+    compiled rule tuple (with transform and datatype converter already
+    resolved), so mapping a payload neither queries the database nor
+    re-dispatches on transform/datatype codes.
+    The cache is keyed on config_cache.config_version(), so saved or deleted
+    map details are picked up without a restart.
+
 Example:
     from apps.imports.services.mapping_engine import apply_mapping
     normalized = apply_mapping(payload, map_set)
     print(normalized)
+
+    text = to_json_text(apply_mapping(payload, map_set, json_safe=False))
 """
 
 from __future__ import annotations
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
 import decimal
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup, json is used otherwise
+    orjson = None
 
 from apps.imports.models.import_map_set import ImportMapSet
 from apps.imports.models.import_map_detail import ImportMapDetail
-from apps.imports.services.transform_utils import apply_transform
+from apps.imports.services.config_cache import config_version
+from apps.imports.services.transform_utils import TRUE_TOKENS, get_transform
 
 
 def make_json_safe(data: dict[str, Any]) -> dict[str, Any]:
@@ -42,48 +59,191 @@ def make_json_safe(data: dict[str, Any]) -> dict[str, Any]:
     return {k: convert(v) for k, v in data.items()}
 
 
-def apply_mapping(payload: dict[str, Any], map_set: ImportMapSet) -> dict[str, Any]:
+def _json_fallback(val: Any) -> Any:
+    """Encoder hook with the make_json_safe rules (Decimal -> float, set -> list, else str)."""
+    if isinstance(val, decimal.Decimal):
+        return float(val)
+    if isinstance(val, set):
+        return list(val)
+    return str(val)
+
+
+def to_json_text(data: dict[str, Any]) -> str:
+    """
+    Serialize a normalized dict straight to JSON text (orjson if available).
+
+    Decimals and sets are converted by the encoder hook, so no JSON-safe copy
+    of the dict has to be built first (see apply_mapping(json_safe=False)).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_json_fallback).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encoder does not
+            pass
+    return json.dumps(data, default=_json_fallback)
+
+
+# ---------------------------------------------------------------------------
+# Datatype converters (chosen once per rule when a map set is compiled)
+# ---------------------------------------------------------------------------
+def _to_int(value: Any) -> Any:
+    return int(value) if value not in (None, "") else value
+
+
+# Shared Decimals for the small ints that dominate quantity/pack-size columns
+_DECIMAL_POOL = {i: decimal.Decimal(i) for i in range(-1, 11)}
+
+
+def _to_decimal(value: Any) -> Any:
+    if value in (None, "") or isinstance(value, decimal.Decimal):
+        return value
+    # ints convert exactly without the str() round trip (bool stays on the str path)
+    if type(value) is int:
+        pooled = _DECIMAL_POOL.get(value)
+        return pooled if pooled is not None else decimal.Decimal(value)
+    return decimal.Decimal(str(value))
+
+
+def _to_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_TOKENS
+    return bool(value) if value not in (None, "") else None
+
+
+def _to_str(value: Any) -> Any:
+    return str(value) if value is not None else None
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "int": _to_int,
+    "decimal": _to_decimal,
+    "bool": _to_bool,
+    "str": _to_str,
+}
+
+
+class MappingRule(NamedTuple):
+    """One compiled ImportMapDetail (plain values, no ORM access per row)."""
+
+    source_path: str
+    target_path: str
+    transform: Optional[str]
+    datatype: str
+    # Converter for the target datatype; None leaves the value unchanged
+    convert: Optional[Callable[[Any], Any]] = None
+    # Resolved transform function; None for no (or an unknown) transform
+    transform_fn: Optional[Callable[[Any], Any]] = None
+
+
+def compile_map_set(map_set_id: int) -> tuple[MappingRule, ...]:
+    """Load the map details of a set once and return them as MappingRule tuples."""
+    return _compile_map_set(map_set_id, config_version())
+
+
+@lru_cache(maxsize=256)
+def _compile_map_set(map_set_id: int, version: int) -> tuple[MappingRule, ...]:
+    details = ImportMapDetail.objects.filter(map_set_id=map_set_id).values_list(
+        "source_path", "target_path", "transform", "target_datatype__code"
+    )
+    return tuple(
+        MappingRule(
+            source, target, transform, datatype,
+            _CONVERTERS.get(datatype),
+            get_transform(transform),
+        )
+        for source, target, transform, datatype in details
+    )
+
+
+def clear_mapping_cache() -> None:
+    """Drop all compiled map sets (e.g. after raw SQL edits that bypass the signals)."""
+    _compile_map_set.cache_clear()
+
+
+def apply_mapping(
+    payload: dict[str, Any],
+    map_set: ImportMapSet,
+    json_safe: bool = True,
+) -> dict[str, Any]:
     """
     Transform a raw payload dict into normalized structure using map_set.
 
     Args:
         payload: The raw supplier payload (dict).
         map_set: ImportMapSet instance with related ImportMapDetails.
+        json_safe: Convert Decimals/sets via make_json_safe (default). Pass
+            False when the result is serialized with to_json_text anyway.
 
     Returns:
-        Normalized dict with mapped + transformed values (JSON-safe).
+        Normalized dict with mapped + transformed values (JSON-safe by default).
     """
     normalized: Dict[str, Any] = {}
 
-    for detail in map_set.map_details.select_related("target_datatype").all():
-        raw_value = payload.get(detail.source_path)
-        value = raw_value
+    for rule in compile_map_set(map_set.pk):
+        value = payload.get(rule.source_path)
 
-        # optional transform
-        if detail.transform:
-            # treat transform as ImportTransformType code
-            value = apply_transform(
-                raw_value, type("Tmp", (), {"code": detail.transform})()
-            )
+        # optional transform (ImportTransformType code, resolved at compile time)
+        if rule.transform_fn is not None:
+            value = rule.transform_fn(value)
 
         # enforce datatype
-        dt_code = detail.target_datatype.code
-        try:
-            if dt_code == "int" and value not in (None, ""):
-                value = int(value)
-            elif dt_code == "decimal" and value not in (None, ""):
-                value = decimal.Decimal(str(value))
-            elif dt_code == "bool":
-                if isinstance(value, str):
-                    value = value.strip().lower() in ("1", "true", "yes", "y")
-                else:
-                    value = bool(value) if value not in (None, "") else None
-            elif dt_code == "str" and value is not None:
-                value = str(value)
-        except Exception:
-            value = None
-
-        normalized[detail.target_path] = value
+        if rule.convert is not None:
+            try:
+                value = rule.convert(value)
+            except Exception:
+                value = None
+
+        normalized[rule.target_path] = value
+
+    if not json_safe:
+        return normalized
 
     # ensure JSONField compatibility
     return make_json_safe(normalized)
+
+
+def _safe_convert(convert: Callable[[Any], Any], value: Any) -> Any:
+    """Apply a datatype converter; failed conversions become None (as in apply_mapping)."""
+    try:
+        return convert(value)
+    except Exception:
+        return None
+
+
+def apply_mapping_many(
+    payloads: Iterable[dict[str, Any]],
+    map_set: ImportMapSet,
+    json_safe: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Map a batch of payloads column by column; same result as apply_mapping per payload.
+
+    Each rule is applied to all payloads in one list comprehension, so rule
+    attributes, transform and converter are resolved once per batch instead
+    of once per payload and field.
+
+    Raises:
+        Any exception apply_mapping would raise for a single payload; callers
+        that need per-record error handling fall back to apply_mapping.
+    """
+    payloads = list(payloads)
+    rows: list[dict[str, Any]] = [{} for _ in payloads]
+
+    for rule in compile_map_set(map_set.pk):
+        source = rule.source_path
+        values = [payload.get(source) for payload in payloads]
+        if rule.transform_fn is not None:
+            transform = rule.transform_fn
+            values = [transform(value) for value in values]
+        if rule.convert is not None:
+            convert = rule.convert
+            values = [_safe_convert(convert, value) for value in values]
+
+        target = rule.target_path
+        for row, value in zip(rows, values):
+            row[target] = value
+
+    if not json_safe:
+        return rows
+    return [make_json_safe(row) for row in rows]
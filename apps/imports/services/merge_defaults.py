@@ -8,6 +8,10 @@ Purpose:
     - load_defaults(org): load defaults as dict
     - merge_defaults(data, org): merge dict with defaults (defaults first)
 
+    The lines of the active default set are loaded once per process and
+    config version (see services.config_cache) and shared read-only; every
+    call only copies/merges the cached mapping.
+
 Example:
     from apps.imports.services import merge_defaults
 
@@ -16,11 +20,29 @@ Example:
 """
 
 from __future__ import annotations
-from typing import Any, Dict
-from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-from apps.imports.models.import_global_default_set import ImportGlobalDefaultSet
 from apps.imports.models.import_global_default_line import ImportGlobalDefaultLine
+from apps.imports.services.config_cache import config_version, get_active_default_set
+
+
+@lru_cache(maxsize=32)
+def _load_defaults_cached(set_id: int, version: int) -> Mapping[str, Any]:
+    """Return {target_path: default_value} of one default set (cached per config version)."""
+    lines = ImportGlobalDefaultLine.objects.filter(set_id=set_id).values_list(
+        "target_path", "default_value"
+    )
+    return MappingProxyType(dict(lines.iterator(chunk_size=2000)))
+
+
+def _cached_defaults(org) -> Mapping[str, Any]:
+    """Return the shared, read-only defaults of the organization's active set."""
+    default_set = get_active_default_set(org.pk)
+    if not default_set:
+        return MappingProxyType({})
+    return _load_defaults_cached(default_set.pk, config_version())
 
 
 def load_defaults(org) -> Dict[str, Any]:
@@ -31,18 +53,9 @@ def load_defaults(org) -> Dict[str, Any]:
         org: Organization instance
 
     Returns:
-        dict of {target_path: default_value}
+        dict of {target_path: default_value} (a fresh copy, safe to modify)
     """
-    default_set = (
-        ImportGlobalDefaultSet.objects.filter(organization=org, valid_from__lte=date.today())
-        .order_by("-valid_from")
-        .first()
-    )
-    if not default_set:
-        return {}
-
-    lines = ImportGlobalDefaultLine.objects.filter(set=default_set)
-    return {line.target_path: line.default_value for line in lines}
+    return dict(_cached_defaults(org))
 
 
 def merge_defaults(data: Dict[str, Any], org) -> Dict[str, Any]:
@@ -56,6 +69,4 @@ def merge_defaults(data: Dict[str, Any], org) -> Dict[str, Any]:
     Returns:
         dict with defaults merged in
     """
-    merged = load_defaults(org)
-    merged.update(data)
-    return merged
+    return {**_cached_defaults(org), **data}
@@ -0,0 +1,193 @@
+# apps/imports/services/raw_record_ops.py
+"""
+Purpose:
+    Bulk ingest helpers for ImportRawRecord. Streams (line_number, payload)
+    rows of an ImportRun into the database with PostgreSQL COPY, falling back
+    to Django bulk_create on other database backends, and refreshes the
+    table's planner statistics after a bulk load.
+
+Context:
+    Part of the `apps.imports.services` package.
+    COPY sends all rows in a single statement instead of one parsed and
+    planned INSERT per batch, and skips ORM model construction entirely.
+
+Used by:
+    - apps/imports/management/commands/universal_excel_importer.py
+    - apps/imports/management/commands/import_komatsu.py
+    - apps/imports/management/commands/import_elsaesser.py
+
+Depends on:
+    - apps.imports.models.import_raw_record.ImportRawRecord
+    - apps.imports.models.import_run.ImportRun
+    - psycopg 3 (cursor.copy) when running on PostgreSQL
+    - orjson (optional, falls back to json for payload serialization)
+
+Example:
+    from apps.imports.services.raw_record_ops import bulk_insert_raw_records
+
+    rows = [(1, {"Part Number": "X123"}), (2, {"Part Number": "X124"})]
+    inserted = bulk_insert_raw_records(run, rows, reference_key="Part Number")
+    print(inserted)  # 2
+"""
+
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Iterable, Tuple
+
+from django.db import DatabaseError, connection
+
+try:
+    import orjson
+except ImportError:  # optional speedup, json is used otherwise
+    orjson = None
+
+from apps.imports.models.import_raw_record import ImportRawRecord
+from apps.imports.models.import_run import ImportRun
+
+logger = logging.getLogger(__name__)
+
+
+# Columns written from the rows; all other columns get their model default
+_COPY_COLUMNS = ("import_run_id", "line_number", "payload", "supplier_product_reference")
+
+
+def _default_columns() -> Tuple[list[str], tuple]:
+    """
+    Return the remaining ImportRawRecord columns and their model defaults.
+
+    The model defaults (False, 0, None) exist only in Django, not in the
+    database, so COPY has to send them explicitly.
+    """
+    fields = [
+        f
+        for f in ImportRawRecord._meta.concrete_fields
+        if not f.primary_key and f.attname not in _COPY_COLUMNS
+    ]
+    return [f.column for f in fields], tuple(f.get_default() for f in fields)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the encoder does not know (pandas Timestamps, NumPy scalars)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _reference(payload: dict[str, Any], reference_key: str | None) -> str | None:
+    """Return the supplier product reference from the payload (None if not configured/empty)."""
+    if reference_key is None:
+        return None
+    value = payload.get(reference_key)
+    return None if value is None else str(value)
+
+
+def _dump_payload(payload: dict[str, Any]) -> str:
+    """Serialize a payload to JSON text for the jsonb column (orjson if available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits (e.g. 1e20 cells, long API ids)
+            pass
+    return json.dumps(payload, default=_json_default)
+
+
+def _copy_raw_records(
+    run: ImportRun,
+    rows: Iterable[Tuple[int, dict[str, Any]]],
+    reference_key: str | None,
+) -> int:
+    """Stream rows into ImportRawRecord with a single COPY ... FROM STDIN."""
+    table = ImportRawRecord._meta.db_table
+    extra_columns, extra_values = _default_columns()
+    columns = ", ".join([*_COPY_COLUMNS, *extra_columns])
+
+    inserted = 0
+    run_id = run.pk
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+            for line_number, payload in rows:
+                reference = _reference(payload, reference_key)
+                copy.write_row(
+                    (run_id, line_number, _dump_payload(payload), reference, *extra_values)
+                )
+                inserted += 1
+    return inserted
+
+
+def _bulk_create_raw_records(
+    run: ImportRun,
+    rows: Iterable[Tuple[int, dict[str, Any]]],
+    reference_key: str | None,
+    batch_size: int,
+) -> int:
+    """Fallback for non-PostgreSQL backends: buffered bulk_create."""
+    buffer: list[ImportRawRecord] = []
+    inserted = 0
+    run_id = run.pk
+    for line_number, payload in rows:
+        buffer.append(
+            ImportRawRecord(
+                import_run_id=run_id,
+                line_number=line_number,
+                payload=payload,
+                supplier_product_reference=_reference(payload, reference_key),
+            )
+        )
+        if len(buffer) >= batch_size:
+            ImportRawRecord.objects.bulk_create(buffer, batch_size)
+            inserted += len(buffer)
+            buffer.clear()
+
+    if buffer:
+        ImportRawRecord.objects.bulk_create(buffer, batch_size)
+        inserted += len(buffer)
+    return inserted
+
+
+def bulk_insert_raw_records(
+    run: ImportRun,
+    rows: Iterable[Tuple[int, dict[str, Any]]],
+    batch_size: int = 50000,
+    reference_key: str | None = None,
+) -> int:
+    """
+    Insert (line_number, payload) rows for an ImportRun.
+
+    Args:
+        run: The ImportRun the records belong to
+        rows: Iterable of (line_number, payload dict)
+        batch_size: bulk_create batch size (non-PostgreSQL backends only)
+        reference_key: Optional payload key copied into supplier_product_reference
+
+    Returns:
+        Number of inserted records
+    """
+    if connection.vendor == "postgresql":
+        return _copy_raw_records(run, rows, reference_key)
+    return _bulk_create_raw_records(run, rows, reference_key, batch_size)
+
+
+def analyze_raw_records() -> None:
+    """
+    Refresh PostgreSQL planner statistics for ImportRawRecord (best effort).
+
+    Call it after the ingest transaction has committed: a failure here is only
+    logged and never affects the status of the ImportRun.
+    """
+    if connection.vendor != "postgresql":
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {ImportRawRecord._meta.db_table}")
+    except DatabaseError:
+        logger.warning("ANALYZE of ImportRawRecord failed", exc_info=True)
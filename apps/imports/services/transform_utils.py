@@ -11,6 +11,7 @@ Context:
 
 Used by:
     - apps/imports/services/import_defaults_ops.py
+    - apps/imports/services/mapping_engine.py (resolves each map detail once via get_transform)
     - Any importer or service applying ImportTransformType mappings
 
 Depends on:
@@ -24,55 +25,104 @@ Example:
     transform = ImportTransformType(code="uppercase")
     result = apply_transform("hello", transform)
     print(result)  # "HELLO"
+    print(apply_transform("hello", "uppercase"))  # "HELLO"
+
+    upper = get_transform("uppercase")
+    print([upper(v) for v in ("a", "b")])  # ["A", "B"]
 """
 
 
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from apps.imports.models.import_transform_type import ImportTransformType
 
 
-def apply_transform(value: Any, transform: Optional[ImportTransformType]) -> Any:
+# Lowercased strings that convert to True; any other string is False
+TRUE_TOKENS = frozenset(("1", "true", "yes", "y"))
+
+
+def _uppercase(value: Any) -> Any:
+    return str(value).upper() if value is not None else None
+
+
+def _lowercase(value: Any) -> Any:
+    return str(value).lower() if value is not None else None
+
+
+def _strip(value: Any) -> Any:
+    return str(value).strip() if value is not None else None
+
+
+def _to_int(value: Any) -> Any:
+    return int(value) if value not in (None, "") else None
+
+
+def _to_decimal(value: Any) -> Any:
+    return Decimal(str(value)) if value not in (None, "") else None
+
+
+def _to_bool(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_TOKENS
+    return bool(value)
+
+
+# ImportTransformType.code → transform function; unknown codes leave the value unchanged
+_TRANSFORMS: dict[str, Callable[[Any], Any]] = {
+    "uppercase": _uppercase,
+    "lowercase": _lowercase,
+    "strip": _strip,
+    "int": _to_int,
+    "decimal": _to_decimal,
+    "bool": _to_bool,
+}
+
+
+def _safe(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a transform so failed conversions return None."""
+    def transform(value: Any) -> Any:
+        try:
+            return fn(value)
+        except (ValueError, InvalidOperation):
+            # If conversion fails, return None for safety
+            return None
+    return transform
+
+
+_SAFE_TRANSFORMS = {code: _safe(fn) for code, fn in _TRANSFORMS.items()}
+
+
+def get_transform(transform: ImportTransformType | str | None) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the transform function for an ImportTransformType (or its code).
+
+    Resolve once and apply to a whole column, instead of dispatching per value.
+    Returns None for no transform or an unknown code (value stays unchanged).
+    """
+    if not transform:
+        return None
+    code = transform if isinstance(transform, str) else transform.code
+    return _SAFE_TRANSFORMS.get(code)
+
+
+def apply_transform(value: Any, transform: ImportTransformType | str | None) -> Any:
     """
     Apply a transformation to a value based on ImportTransformType.
 
     Args:
         value: Input value (string, int, etc.)
-        transform: ImportTransformType instance or None
+        transform: ImportTransformType instance, its code (e.g. "uppercase") or None
 
     Returns:
         Transformed value
     """
-    if transform is None:
+    fn = get_transform(transform)
+    if fn is None:
+        # No or unknown transform → return unchanged
         return value
-
-    code = transform.code
-
-    try:
-        if code == "uppercase":
-            return str(value).upper() if value is not None else None
-        elif code == "lowercase":
-            return str(value).lower() if value is not None else None
-        elif code == "strip":
-            return str(value).strip() if value is not None else None
-        elif code == "int":
-            return int(value) if value not in (None, "") else None
-        elif code == "decimal":
-            return Decimal(str(value)) if value not in (None, "") else None
-        elif code == "bool":
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                return value.strip().lower() in ("1", "true", "yes", "y")
-            return bool(value)
-        else:
-            # Unknown transform → return unchanged
-            return value
-    except (ValueError, InvalidOperation):
-        # If conversion fails, return None for safety
-        return None
-
-
+    return fn(value)
@@ -1,3 +1,27 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from apps.imports.models.fields import FastJSONField
+from apps.imports.services.mapping_engine import to_json_text
+from apps.imports.services.raw_record_ops import _dump_payload
+
+
+class DumpPayloadTests(SimpleTestCase):
+    def test_integer_beyond_64_bits_is_serialized(self):
+        payload = {"Part Number": "X123", "big": 2**70}
+        self.assertEqual(json.loads(_dump_payload(payload)), payload)
+
+
+class FastJSONFieldTests(SimpleTestCase):
+    def test_integer_beyond_64_bits_round_trips(self):
+        payload = {"big": 123456789012345678901234, "neg": -(2**63) - 1, "name": "X123"}
+        value = FastJSONField().from_db_value(json.dumps(payload), None, None)
+        self.assertEqual(value, payload)
+        self.assertIsInstance(value["big"], int)
+
+
+class ToJsonTextTests(SimpleTestCase):
+    def test_integer_beyond_64_bits_is_serialized(self):
+        data = {"product.productNumber": "X123", "variant.weight": 2**70}
+        self.assertEqual(json.loads(to_json_text(data)), data)
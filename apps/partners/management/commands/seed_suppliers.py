@@ -19,7 +19,7 @@ Used by:
 Depends on:
     - apps.core.models.organization.Organization
     - apps.partners.models.supplier.Supplier
-    - Django ORM (update_or_create, transaction.atomic)
+    - Django ORM (bulk_create with update_conflicts, transaction.atomic)
 
 Example:
     # Create a default test supplier (inactive)
@@ -44,8 +44,11 @@ from apps.partners.models.supplier import Supplier
 
 logger = logging.getLogger(__name__)
 
-_TRUE = {"1", "true", "t", "yes", "y"}
-_FALSE = {"0", "false", "f", "no", "n"}
+# Accepted boolean tokens (lowercased) → value
+_BOOL_TOKENS: dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y"), True),
+    **dict.fromkeys(("0", "false", "f", "no", "n"), False),
+}
 
 
 def _parse_bool(token: str, default: Optional[bool] = None) -> bool:
@@ -53,11 +56,10 @@ def _parse_bool(token: str, default: Optional[bool] = None) -> bool:
     t = (token or "").strip().lower()
     if t == "" and default is not None:
         return default
-    if t in _TRUE:
-        return True
-    if t in _FALSE:
-        return False
-    raise ValueError(f"Invalid boolean value: '{token}'")
+    value = _BOOL_TOKENS.get(t)
+    if value is None:
+        raise ValueError(f"Invalid boolean value: '{token}'")
+    return value
 
 
 def parse_items(raw: str) -> List[Tuple[int, str, str, Optional[bool]]]:
@@ -134,10 +136,19 @@ class Command(BaseCommand):
                     'No items provided. Example: --items "1:SUPP01:Default Supplier:0"'
                 )
 
-            created, updated = 0, 0
+            # Resolve all organizations with one query
+            org_by_code = {
+                org.org_code: org
+                for org in Organization.objects.filter(org_code__in={item[0] for item in items})
+            }
+
+            # One row per (org, code); a repeated item overrides the earlier one
+            rows: dict[tuple[int, str], Supplier] = {}
 
             for org_code, code, desc, active_val in items:
-                org = Organization.objects.get(org_code=org_code)
+                org = org_by_code.get(org_code)
+                if org is None:
+                    raise CommandError(f"Organization '{org_code}' not found")
 
                 if dry_run:
                     self.stdout.write(
@@ -146,20 +157,38 @@ class Command(BaseCommand):
                     )
                     continue
 
-                obj, was_created = Supplier.objects.update_or_create(
+                rows[(org_code, code)] = Supplier(
                     organization=org,
                     supplier_code=code,
-                    defaults={
-                        "supplier_description": desc or "Supplier",
-                        "is_active": active_val if active_val is not None else True,
-                    },
+                    supplier_description=desc or "Supplier",
+                    is_active=active_val if active_val is not None else True,
+                )
+
+            created, updated = 0, 0
+            if rows:
+                existing = set(
+                    Supplier.objects.filter(
+                        organization_id__in={org_code for org_code, _ in rows},
+                        supplier_code__in={code for _, code in rows},
+                    ).values_list("organization_id", "supplier_code")
+                )
+
+                # Single INSERT ... ON CONFLICT DO UPDATE instead of update_or_create per item
+                Supplier.objects.bulk_create(
+                    rows.values(),
+                    batch_size=1000,
+                    update_conflicts=True,
+                    unique_fields=["organization", "supplier_code"],
+                    update_fields=["supplier_description", "is_active"],
                 )
-                if was_created:
-                    created += 1
-                    self.stdout.write(f"Created supplier {obj.supplier_code} (org={org_code})")
-                else:
-                    updated += 1
-                    self.stdout.write(f"Updated supplier {obj.supplier_code} (org={org_code})")
+
+                for org_code, code in rows:
+                    if (org_code, code) in existing:
+                        updated += 1
+                        self.stdout.write(f"Updated supplier {code} (org={org_code})")
+                    else:
+                        created += 1
+                        self.stdout.write(f"Created supplier {code} (org={org_code})")
 
             self.stdout.write(self.style.SUCCESS(f"Done. Created: {created}, Updated: {updated}."))
 
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('partners', '0003_supplier_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['organization'], name='idx_customer_org_active'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['organization'], name='idx_supplier_org_active'),
+        ),
+    ]
@@ -54,6 +54,7 @@ Example:
 from __future__ import annotations
 
 from django.db import models
+from django.db.models import Q
 from django.db.models.functions import Now
 
 
@@ -133,10 +134,14 @@ class Customer(models.Model):
         # db_table = "customer"
         verbose_name = "Customer"
         verbose_name_plural = "Customers"
-        # indexes = [
-        #     models.Index(fields=["organization"], name="idx_customer_org"),
-        #     models.Index(fields=["is_active"], name="idx_customer_active"),
-        # ]
+        # organization alone is covered by the (organization, customer_code) unique index
+        indexes = [
+            models.Index(
+                fields=["organization"],
+                condition=Q(is_active=True),
+                name="idx_customer_org_active",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["organization", "customer_code"],
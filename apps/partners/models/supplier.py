@@ -58,6 +58,7 @@ Example:
 from __future__ import annotations
 
 from django.db import models
+from django.db.models import Q
 from django.db.models.functions import Now
 
 
@@ -142,9 +143,14 @@ class Supplier(models.Model):
         # db_table = "supplier"
         verbose_name = "Supplier"
         verbose_name_plural = "Suppliers"
-        # indexes = [
-        #     models.Index(fields=["organization"], name="idx_supplier_org"),
-        # ]
+        # organization alone is covered by the (organization, supplier_code) unique index
+        indexes = [
+            models.Index(
+                fields=["organization"],
+                condition=Q(is_active=True),
+                name="idx_supplier_org_active",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["organization", "supplier_code"],
@@ -140,3 +140,6 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Pandas engine for supplier Excel imports ("calamine" or "openpyxl")
+IMPORT_EXCEL_ENGINE = os.getenv("IMPORT_EXCEL_ENGINE", "calamine")